@@ -1,18 +1,35 @@
 import streamlit as st
-import feedparser
-import requests
 import datetime
 from datetime import date, timedelta
-import json
-from openai import OpenAI
+import orjson
+import re
 import os
 from dotenv import load_dotenv
-import random
+import heapq
 import time
+import itertools
+import concurrent.futures
+import asyncio
+import hashlib
+import diskcache
+from dataclasses import dataclass, astuple
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+# feedparser, openai, requests_cache and numpy are slow to import and aren't needed until a
+# scan actually runs, so they are imported inside the functions that use them to keep the
+# first page load fast.
+
+try:
+    import ahocorasick
+except ImportError:
+    # Optional. Without it the term filters fall back to a compiled regex.
+    ahocorasick = None
 
 # --- CONFIGURATION & SECURITY ---
 load_dotenv()
 
+# Deliberately not cached, so a key added to the secrets or .env after a failed start
+# is picked up on the next rerun instead of needing a server restart
 def get_api_key():
     if "OPENAI_API_KEY" in st.secrets:
         return st.secrets["OPENAI_API_KEY"]
@@ -23,12 +40,76 @@ if not api_key:
     st.error("API Key not found! Please set OPENAI_API_KEY in Streamlit Secrets.")
     st.stop()
 
-client = OpenAI(api_key=api_key)
+@st.cache_resource(show_spinner=False)
+def get_batch_client():
+    """
+    Plain (non-async) OpenAI client for the Batch API: file uploads and job polling.
+    Built once and shared by every session. (The async scoring client can't be shared
+    like this: it's tied to the event loop of the scan that created it.)
+    """
+    from openai import OpenAI
+    return OpenAI(api_key=get_api_key())
+
+HTTP_HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) PopMech-Scanner/1.0"}
+
+# Built on the first scan and then shared by every rerun and session, instead of being
+# reopened each time the page reruns
+@st.cache_resource(show_spinner=False)
+def get_session():
+    """
+    One shared HTTP session with an on-disk cache. Repeat scans within the hour are served
+    locally, and once an entry goes stale, sources that send ETag/Last-Modified are
+    revalidated with a cheap conditional GET (a 304) instead of a full download.
+    """
+    import requests_cache
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests_cache.CachedSession(
+        'sns_cache',
+        backend='sqlite',
+        expire_after=3600,
+        cache_control=True
+    )
+    
+    # Keep connections open between requests (OpenAlex alone gets 9 queries) and let the
+    # fetcher threads share them. Transient server errors and 429s are retried with backoff.
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(HTTP_HEADERS)
+    return session
+
+# Parsed RSS entries, keyed by feed URL + ETag (or a hash of the body). When a feed
+# hasn't changed since the last scan we reuse its entries and skip feedparser entirely.
+# (Opened once per process like the session, instead of reopening sqlite every rerun.)
+@st.cache_resource(show_spinner=False)
+def get_feed_cache():
+    return diskcache.Cache('.sns_feed_cache')
+
+FEED_CACHE_TTL = 2 * 86400
 
 # --- TARGETING PARAMETERS ---
 # We look back 5 days to ensure we catch the Nov 18 window
 START_DATE = datetime.date.today() - timedelta(days=5)
 
+# We run separate OpenAlex queries for distinct topics to ensure one doesn't drown out the others
+OPENALEX_QUERIES = [
+    "time travel OR closed timelike curve OR wormhole OR time",
+    "quantum OR higher dimension OR dimensional OR dimensionality",
+    "artificial intelligence OR large language model OR agi",
+    "quantum entanglement OR holographic OR many worlds OR physics",
+    "synthetic biology OR crispr OR resurrection OR longevity",
+    "consciousness OR cognitive OR neural OR mind",
+    "biology OR evolution",
+    "Earth OR environment OR environmental",
+    "futurism OR simulation"
+]
+
 # BANNED TERMS (Stops the "Flipped Classroom" / Policy papers)
 EXCLUDE_TERMS = [
     "classroom", "education", "pedagogy", "curriculum", "funding", 
@@ -36,81 +117,201 @@ EXCLUDE_TERMS = [
     "student", "campus", "undergraduate", "flipped"
 ]
 
+# OSF has no real search, so its firehose is kept only if it mentions one of these
+RELEVANT_KEYWORDS = ["quantum", "ai", "intelligence", "neural", "physics", "bio", "genome", "space", "time", "simulation"]
+
+# Terms that signal a PopMech topic. Used to decide which candidates are worth the AI's time.
+# The query phrases are kept whole: split into words, "large language model" and "closed
+# timelike curve" would turn "model", "large" and "curve" into topic hits for any paper.
+TOPIC_TERMS = sorted({
+    term.strip().lower()
+    for q in OPENALEX_QUERIES
+    for term in q.split(" OR ")
+} | set(RELEVANT_KEYWORDS))
+
+# Paper types that never make a short-form story, however on-topic they are
+LOW_VALUE_TERMS = [
+    "meta-analysis", "meta analysis", "systematic review", "scoping review",
+    "retraction", "retracted", "corrigendum", "study protocol"
+]
+
+# "Small but astounding" signals. A candidate needs one of these or a topic term
+# before it's worth paying the AI to look at it.
+NOVELTY_WORDS = [
+    "first", "smallest", "largest", "weird", "strange", "unexpected", "surprising",
+    "discover", "discovered", "discovery", "record", "breakthrough", "tiny", "nano", "micro"
+]
+SIGNAL_TERMS = TOPIC_TERMS + NOVELTY_WORDS
+
+# When two articles hit the same number of topic terms, prefer the better-targeted source
+SOURCE_PRIORITY = {"OpenAlex": 2, "RSS": 1, "OSF": 0}
+
+# Each term list is compiled into a single matcher so the text is scanned once instead of once
+# per term. An Aho-Corasick automaton keeps that one pass linear no matter how long the lists get;
+# the regex alternation is the fallback when pyahocorasick isn't installed.
+# (Plain substring matching on purpose: "student" also catches "students".)
+def _build_term_matcher(terms):
+    """
+    Returns a function that tells whether a text contains any of the terms (case-insensitive).
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for term in terms:
+            automaton.add_word(term.lower(), term)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text.lower()), None) is not None
+    
+    pattern = re.compile('|'.join(map(re.escape, terms)), re.IGNORECASE)
+    return lambda text: pattern.search(text) is not None
+
+_has_junk_term = _build_term_matcher(EXCLUDE_TERMS)
+_has_relevant_term = _build_term_matcher(RELEVANT_KEYWORDS)
+_has_low_value_term = _build_term_matcher(LOW_VALUE_TERMS)
+
 # --- HELPER FUNCTIONS ---
 
+# Slotted, so there's no per-article __dict__: a few hundred of these stay small
+# and attribute access is a fixed offset rather than a dict lookup
+@dataclass(slots=True)
+class Article:
+    title: str
+    link: str | None
+    summary: str
+    source: str
+
 def is_junk(title, summary):
     """
     Returns True if the paper is likely administrative/educational junk.
     """
-    text = (title + " " + summary).lower()
-    for term in EXCLUDE_TERMS:
-        if term in text:
-            return True
-    return False
+    return _has_junk_term(title) or _has_junk_term(summary)
+
+# Below this a "summary" is just a stub ("N/A", a lone keyword) that tells the AI nothing
+MIN_SUMMARY_CHARS = 20
+
+def is_scoreable(article):
+    """
+    Returns True if the article gives the AI something to judge. Empty or stub
+    titles and summaries (OSF and OpenAlex both send these) would just burn tokens.
+    """
+    title = (article.title or '').strip()
+    return len(title) >= 10 and len((article.summary or '').strip()) >= MIN_SUMMARY_CHARS
+
+def _article_text(article):
+    """
+    Title + summary as lowercase words separated by single spaces (and padded with
+    one at each end), so a term matches as `f" {term} " in text` on word boundaries.
+    """
+    words = re.findall(r'\w+', (article.title + " " + article.summary).lower())
+    return f" {' '.join(words)} "
+
+def _count_terms(text, terms):
+    """
+    How many different terms the text hits. A term that is part of a longer one that
+    also hit ("quantum" in "quantum entanglement") isn't counted on top of it.
+    """
+    hits = [term for term in terms if f" {term} " in text]
+    return sum(not any(term != other and f" {term} " in f" {other} " for other in hits) for term in hits)
+
+def worth_scoring(article):
+    """
+    Cheap check before the AI stage: drops reviews/retractions and anything that
+    has neither a topic term nor a novelty word.
+    """
+    if _has_low_value_term(article.title) or _has_low_value_term(article.summary):
+        return False
+    text = _article_text(article)
+    return any(f" {term} " in text for term in SIGNAL_TERMS)
+
+def _canonical_link(link):
+    """
+    Normalizes a URL for duplicate matching: drops the scheme, query string
+    (feeds love tracking params like ?af=R), fragment and trailing slash.
+    """
+    link = (link or '').strip().lower()
+    link = link.split('#')[0].split('?')[0].rstrip('/')
+    return link.split('://', 1)[-1]
+
+def dedupe_articles(articles):
+    """
+    Removes duplicate papers, matching on link (DOI) as well as title so the same
+    paper showing up in OpenAlex and an RSS feed only gets sent to the AI once.
+    """
+    seen = set()
+    unique = []
+    for a in articles:
+        title_key = ' '.join(a.title.lower().split())
+        link_key = _canonical_link(a.link)
+        if title_key in seen or (link_key and link_key in seen):
+            continue
+        seen.add(title_key)
+        if link_key:
+            seen.add(link_key)
+        unique.append(a)
+    return unique
 
 # --- FETCHING FUNCTIONS ---
 
-def fetch_openalex_targeted():
+OPENALEX_URL = "https://api.openalex.org/works"
+
+def _openalex_query(q, refresh=False):
     """
-    Fires specific, separate queries for each PopMech category to guarantee variety.
+    Runs a single OpenAlex category query. Runs inside a worker thread.
+    refresh=True downloads a fresh copy instead of using the HTTP cache.
     """
-    st.write(f"...Targeting OpenAlex (Papers since {START_DATE})...")
     articles = []
     
-    # We run separate queries for distinct topics to ensure one doesn't drown out the others
-    queries = [
-        "time travel OR closed timelike curve OR wormhole OR time",
-        "quantum OR higher dimension OR dimensional OR dimensionality"
-        "artificial intelligence OR large language model OR agi",
-        "quantum entanglement OR holographic OR many worlds OR physics",
-        "synthetic biology OR crispr OR resurrection OR longevity",
-        "consciousness OR cognitive OR neural OR mind",
-        "biology OR evolution",
-        "Earth OR environment OR environmental",
-        "futurism OR simulation"
-    ]
+    # Construct filter: Published recently AND matches query in Title/Abstract
+    filter_param = f"from_publication_date:{START_DATE},title_and_abstract.search:{q}"
+    params = {
+        'filter': filter_param,
+        'per-page': 5, # Get top 5 for EACH category
+        'sort': 'relevance_score:desc' # Get the best matches, not just newest
+    }
     
-    base_url = "https://api.openalex.org/works"
+    try:
+        r = get_session().get(OPENALEX_URL, params=params, timeout=5, force_refresh=refresh)
+        if r.status_code == 200:
+            data = orjson.loads(r.content)
+            for item in data.get('results', []):
+                get = item.get
+                title = get('title')
+                if not title: continue
+                
+                # OpenAlex abstract handling
+                abstract = "No abstract available."
+                # (OpenAlex uses an inverted index for abstracts, often too complex to reconstruct quickly.
+                # We rely on the Title + Concepts list for the AI judgment).
+                # ('concepts' can come back as null, not just missing)
+                concepts = [c['display_name'] for c in itertools.islice(get('concepts') or (), 5)]
+                summary = f"Key Concepts: {', '.join(concepts)}" if concepts else ""
+                
+                if not is_junk(title, summary):
+                    articles.append(Article(
+                        title=title,
+                        link=get('doi') or get('id'),
+                        summary=summary,
+                        source=f"OpenAlex ({q.split(' OR ')[0]}...)"
+                    ))
+    except Exception as e:
+        print(f"OpenAlex Error on {q}: {e}")
+
+    return articles
+
+def fetch_openalex_targeted(refresh=False):
+    """
+    Fires specific, separate queries for each PopMech category to guarantee variety.
+    """
+    st.write(f"...Targeting OpenAlex (Papers since {START_DATE})...")
     
-    for q in queries:
-        # Construct filter: Published recently AND matches query in Title/Abstract
-        filter_param = f"from_publication_date:{START_DATE},title_and_abstract.search:{q}"
-        params = {
-            'filter': filter_param,
-            'per-page': 5, # Get top 5 for EACH category
-            'sort': 'relevance_score:desc' # Get the best matches, not just newest
-        }
-        
-        try:
-            r = requests.get(base_url, params=params, timeout=5)
-            if r.status_code == 200:
-                data = r.json()
-                for item in data.get('results', []):
-                    title = item.get('title')
-                    if not title: continue
-                    
-                    # OpenAlex abstract handling
-                    abstract = "No abstract available."
-                    # (OpenAlex uses an inverted index for abstracts, often too complex to reconstruct quickly.
-                    # We rely on the Title + Concepts list for the AI judgment).
-                    concepts = [c['display_name'] for c in item.get('concepts', [])[:5]]
-                    summary = f"Key Concepts: {', '.join(concepts)}"
-                    
-                    if not is_junk(title, summary):
-                        articles.append({
-                            'title': title,
-                            'link': item.get('doi') or item.get('id'),
-                            'summary': summary,
-                            'source': f"OpenAlex ({q.split(' OR ')[0]}...)"
-                        })
-            time.sleep(0.2) # Be nice to the API
-        except Exception as e:
-            print(f"OpenAlex Error on {q}: {e}")
-            continue
+    # OpenAlex is happy with a few parallel requests, so instead of sleeping between
+    # queries we run them side by side and just cap how many are in flight (be nice to the API)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        results = executor.map(lambda q: _openalex_query(q, refresh), OPENALEX_QUERIES)
+        articles = list(itertools.chain.from_iterable(results))
 
     return articles
 
-def fetch_osf_preprints():
+def fetch_osf_preprints(refresh=False):
     """
     Fetches raw recent preprints from OSF and filters locally.
     """
@@ -126,36 +327,98 @@ def fetch_osf_preprints():
     }
     
     try:
-        r = requests.get(url, params=params, timeout=10)
-        data = r.json()
-        
-        relevant_keywords = ["quantum", "ai", "intelligence", "neural", "physics", "bio", "genome", "space", "time", "simulation"]
+        r = get_session().get(url, params=params, timeout=10, force_refresh=refresh)
+        data = orjson.loads(r.content)
         
         for item in data.get('data', []):
-            attrs = item.get('attributes', {})
-            title = attrs.get('title', '')
-            desc = attrs.get('description', '') or ""
-            
-            full_text = (title + desc).lower()
+            # OSF sends explicit nulls, so "or" rather than .get() defaults
+            attrs = item.get('attributes') or {}
+            title = attrs.get('title') or ""
+            desc = attrs.get('description') or ""
             
             # 1. Check for Junk
             if is_junk(title, desc):
                 continue
                 
             # 2. Check for Relevance
-            if any(k in full_text for k in relevant_keywords):
-                articles.append({
-                    'title': title,
-                    'link': item.get('links', {}).get('html'),
-                    'summary': desc[:500],
-                    'source': 'OSF Preprint'
-                })
+            if _has_relevant_term(title) or _has_relevant_term(desc):
+                articles.append(Article(
+                    title=title,
+                    link=(item.get('links') or {}).get('html'),
+                    summary=desc[:500],
+                    source='OSF Preprint'
+                ))
     except Exception as e:
         print(f"OSF Error: {e}")
         
     return articles
 
-def fetch_rss_feeds():
+def _parse_feed(url, response):
+    """
+    Turns a feed response into {'source': feed title, 'entries': [plain entry dicts]},
+    reusing the previous parse when the feed content hasn't changed.
+    """
+    headers = response.headers
+    version = headers.get('ETag') or headers.get('Last-Modified') or hashlib.sha1(response.content).hexdigest()
+    key = f"{url}|{version}"
+    
+    parsed = get_feed_cache().get(key)
+    if parsed is not None:
+        return parsed
+    
+    from feed_parser import parse_minimal
+    
+    # Go deeper! Top 10 instead of Top 3
+    source, entries = parse_minimal(response.content, limit=10)
+    
+    if not entries:
+        # The fast path found nothing (unusual format or badly broken XML), so let
+        # feedparser and its much more forgiving parser have a go
+        import feedparser
+        
+        # We only need plain title/summary text for the AI (nothing here is rendered as HTML),
+        # so skip feedparser's extra HTML-sanitizing and link-rewriting passes over every entry
+        feed = feedparser.parse(response.content, sanitize_html=False, resolve_relative_uris=False)
+        source = feed.feed.get('title')
+        for entry in feed.entries[:10]:
+            get = entry.get
+            entries.append({
+                'title': get('title', ''),
+                'link': get('link'),
+                'summary': get('summary', '')[:600]
+            })
+    
+    parsed = {'source': source or 'RSS Source', 'entries': entries}
+    get_feed_cache().set(key, parsed, expire=FEED_CACHE_TTL)
+    return parsed
+
+def _fetch_one(url, refresh=False):
+    """
+    Downloads and filters a single RSS feed. Runs inside a worker thread.
+    """
+    articles = []
+    try:
+        response = get_session().get(url, timeout=10, force_refresh=refresh)
+        parsed = _parse_feed(url, response)
+        source = parsed['source']
+        
+        for entry in parsed['entries']:
+            # IMMEDIATE TRASH FILTER
+            if is_junk(entry['title'], entry['summary']):
+                continue
+
+            articles.append(Article(
+                title=entry['title'],
+                link=entry['link'],
+                summary=entry['summary'],
+                source=source
+            ))
+    except Exception as e:
+        print(f"RSS Error on {url}: {e}")
+        
+    return articles
+
+def fetch_rss_feeds(refresh=False):
     """
     Fetches from standard RSS feeds but goes deeper (Top 10).
     """
@@ -170,43 +433,432 @@ def fetch_rss_feeds():
         "https://www.pnas.org/action/showFeed?type=etoc&journalCode=pnas"
     ]
     
-    articles = []
-    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) PopMech-Scanner/1.0"}
+    # Feeds are pure network wait, so download them all at once instead of one after another,
+    # ticking the progress bar as each one lands
+    progress_bar = st.progress(0)
+    by_url = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {executor.submit(_fetch_one, url, refresh): url for url in feed_urls}
+        for done, future in enumerate(concurrent.futures.as_completed(futures), start=1):
+            by_url[futures[future]] = future.result()
+            progress_bar.progress(done / len(feed_urls))
+    progress_bar.empty()
     
-    for url in feed_urls:
-        try:
-            response = requests.get(url, headers=headers, timeout=10)
-            feed = feedparser.parse(response.content)
-            
-            # Go deeper! Top 10 instead of Top 3
-            for entry in feed.entries[:10]:
-                title = entry.title
-                summary = getattr(entry, 'summary', '')[:600]
-                
-                # IMMEDIATE TRASH FILTER
-                if is_junk(title, summary):
-                    continue
-
-                articles.append({
-                    'title': title,
-                    'link': entry.link,
-                    'summary': summary,
-                    'source': feed.feed.get('title', 'RSS Source')
-                })
-        except:
-            continue
+    # Put the feeds back in their listed order so the scan doesn't depend on which one was fastest
+    articles = list(itertools.chain.from_iterable(by_url[url] for url in feed_urls))
             
     return articles
 
-def analyze_with_ai(articles):
-    results = []
+# --- AI SCORING ---
+
+# Articles are scored a handful at a time. Bigger batches save prompt tokens but
+# make the model slower and sloppier, so we keep them small.
+AI_BATCH_SIZE = 8
+
+# How many batches may be waiting on OpenAI at the same time (keeps us under the rate limits)
+AI_MAX_CONCURRENCY = 8
+
+AI_MODEL = "gpt-4o-mini"
+
+# Bump this whenever the prompts or result schemas change, so verdicts made
+# under the old instructions stop being reused.
+PROMPT_VERSION = 2
+
+# Articles scoring at least this much are winners (and get a pitch written)
+WINNING_SCORE = 6
+
+# Every AI verdict is kept on disk for a week, so re-running the scan (today or
+# tomorrow) doesn't pay to re-score papers the AI has already seen.
+@st.cache_resource(show_spinner=False)
+def get_score_cache():
+    return diskcache.Cache('.sns_score_cache')
+
+SCORE_CACHE_TTL = 7 * 86400
+
+# Semantic cache: the same news often comes back with a reworded title ("Astronomers
+# detect X" / "Scientists find X"). Embedding an article costs ~100x less than scoring
+# it, so new articles are embedded first and reuse the score of any near-identical
+# article we have already scored (the pitch is still written for the article itself).
+EMBED_MODEL = "text-embedding-3-small"
+SEMANTIC_MATCH = 0.92 # Cosine similarity at which two articles count as the same story
+SEMANTIC_CACHE_SIZE = 2000 # How many past verdicts it remembers
+SEMANTIC_INDEX_KEY = f"semantic-index|{PROMPT_VERSION}|{AI_MODEL}|{EMBED_MODEL}"
+
+# The AI only needs the gist of an abstract to judge it. Summaries are the bulk of
+# every batch's prompt, so each one is cut to about this many tokens before sending.
+SUMMARY_TOKENS = 80
+TOKENIZER_TIMEOUT = 10 # Seconds to wait on tiktoken's first-use download before cutting by characters
+
+@st.cache_resource(show_spinner=False)
+def get_tokenizer():
+    """
+    The model's tokenizer. tiktoken downloads its vocabulary on first use (with no
+    timeout of its own), so the load gets TOKENIZER_TIMEOUT seconds; point
+    TIKTOKEN_CACHE_DIR at a folder that already has the file to skip the download.
+    Raises if it can't be loaded. Streamlit doesn't cache exceptions, so a later
+    scan tries again instead of cutting by characters until the app restarts.
+    """
+    import tiktoken
     
-    # SHUFFLE the articles so PNAS isn't always first
-    random.shuffle(articles)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    try:
+        return executor.submit(tiktoken.encoding_for_model, AI_MODEL).result(timeout=TOKENIZER_TIMEOUT)
+    finally:
+        executor.shutdown(wait=False) # Don't sit on a hung download
+
+def _short_summary(text, enc):
+    """
+    Trims a summary to SUMMARY_TOKENS tokens, cutting on a token boundary.
+    enc is the tokenizer, or None to cut by characters instead.
+    """
+    if enc is None:
+        return text[:SUMMARY_TOKENS * 4] # Roughly 4 characters per token in English
+    tokens = enc.encode(text, disallowed_special=())
+    if len(tokens) <= SUMMARY_TOKENS:
+        return text
+    # A cut can land inside a multi-byte character, which decodes to a stray U+FFFD
+    return enc.decode(tokens[:SUMMARY_TOKENS]).rstrip('\ufffd')
+
+# Scoring is done in two passes. Output tokens cost 4x input tokens, and a pitch is
+# ~200 of them, so the first pass only asks for a score per article and the second
+# pass writes headlines and pitches for the few articles that made the cut.
+#
+# Each editor brief is the same for every batch, so it is sent once per call as the
+# system message and only the list of articles changes. Keep them fixed strings (no
+# dates or counts formatted in): OpenAI caches a repeated prompt prefix and bills it
+# at half price, but only if it is byte-for-byte identical and at least 1024 tokens.
+# Ours are well under that, and padding them out to qualify would cost more than the
+# discount saves, so the real saving is in sending less per article (see SUMMARY_TOKENS).
+SCORE_PROMPT = """Role: Deputy Short-Form Science Editor at Popular Mechanics.
+
+You will receive a JSON list of papers: {"articles": [{"id": 0, "title": "...", "summary": "...", "source": "..."}, ...]}
+
+For EACH paper, decide whether it meets these CRITERIA:
+1. TOPIC: Evolution, Biology, Earth Sciences, Environmental Sciences, AI, Futurism, Time, Time Travel, Consciousness, the Mind, Simulation, Holographic, Quantum, Resurrection, Higher Dimensional Physics, Life Extension
+2. CONTENT: "Meaningful advance in biology, physics, cognitive psychology, artificial intelligence, Earth sciences, or environmental sciences" or "Contains cause-effect explanations" or "Content can be comprehensibly summarized for Popular Mechanics readers" or "Content can be used to ask and answer meaningful questions"
+3. EXCLUDE: Education, Policy, Incremental tweaks, boring math proofs.
+
+If NO, give it score 0.
+If YES, give it a score of 7-10 based on newsworthiness and reader appeal.
+
+Return one result per paper, using the paper's id.
+"""
+
+PITCH_PROMPT = """Role: Deputy Short-Form Science Editor at Popular Mechanics.
+
+You will receive a JSON list of papers that have already been picked for a story: {"articles": [{"id": 0, "title": "...", "summary": "...", "source": "..."}, ...]}
+
+For EACH paper, create a compelling story pitch with:
+- headline: Punchy, engaging headline in Popular Mechanics style (8-12 words)
+- dek: One-sentence subhead that expands on the headline (15-25 words)
+- pitch: A vivid, conversational pitch paragraph (100-150 words) that:
+  * Summarizes the research clearly without jargon
+  * Explains WHY this matters to general readers
+  * Highlights the broader implications or "wow" factor
+  * Uses accessible language and concrete examples
+  * Captures Popular Mechanics' voice: curious, intelligent, but never stuffy
+
+Return one result per paper, using the paper's id.
+"""
+
+def _response_format(name, fields):
+    """
+    Structured Outputs: OpenAI guarantees the reply matches this schema, so we never lose
+    a batch to malformed JSON and the prompt doesn't need to spell out the format.
+    `fields` maps each result field (besides the id) to its JSON type.
+    """
+    result_schema = {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}, **{f: {"type": t} for f, t in fields.items()}},
+        "required": ["id", *fields],
+        "additionalProperties": False
+    }
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {"results": {"type": "array", "items": result_schema}},
+                "required": ["results"],
+                "additionalProperties": False
+            }
+        }
+    }
+
+SCORE_RESPONSE_FORMAT = _response_format("story_scores", {"score": "integer"})
+PITCH_RESPONSE_FORMAT = _response_format("story_pitches", {"headline": "string", "dek": "string", "pitch": "string"})
+
+def _score_key(article):
+    """
+    Cache key for an article's AI verdict. Includes the prompt version and model so
+    a changed prompt or model never serves stale verdicts.
+    """
+    raw = f"{PROMPT_VERSION}|{AI_MODEL}|{article.title}|{article.summary}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+def _chat_request(chunk, pitch=False):
+    """
+    Builds the chat completion request for one batch of articles: the scoring pass, or
+    with pitch=True the pitch-writing pass. Shared by the live scan and the Batch API
+    scan so both send the same thing.
+    """
+    # Scoring only needs the gist, but a pitch written from a trimmed summary invites
+    # made-up details, and only the few winners reach that pass anyway
+    enc = None
+    if not pitch:
+        try:
+            enc = get_tokenizer()
+        except Exception as e:
+            print(f"Tokenizer unavailable, trimming summaries by characters: {e!r}")
+    payload = {"articles": [
+        {"id": i, "title": a.title, "summary": a.summary if pitch else _short_summary(a.summary, enc), "source": a.source}
+        for i, a in enumerate(chunk)
+    ]}
+    # orjson writes compact JSON and leaves non-ASCII as-is (no \uXXXX escapes), which keeps the prompt short
+    return {
+        "model": AI_MODEL,
+        "messages": [{"role": "system", "content": PITCH_PROMPT if pitch else SCORE_PROMPT},
+                     {"role": "user", "content": orjson.dumps(payload).decode()}],
+        "response_format": PITCH_RESPONSE_FORMAT if pitch else SCORE_RESPONSE_FORMAT,
+        "temperature": 0.7
+    }
+
+def _join_results(chunk, content):
+    """
+    Parses the AI's JSON reply for one batch and matches each result back to its
+    article via the id we sent. Returns a list of (article, result) pairs.
+    """
+    data = orjson.loads(content)
     
-    # Cap the analysis at 25 articles to save tokens/time, but since we shuffled,
-    # it's a random sample of the best candidates.
-    selection = articles[:25]
+    joined = []
+    for result in data.get("results", []):
+        idx = result.pop("id", None)
+        if isinstance(idx, int) and 0 <= idx < len(chunk):
+            joined.append((chunk[idx], result))
+    return joined
+
+def _needs_pitch(ai_data):
+    return ai_data.get("score", 0) >= WINNING_SCORE and "pitch" not in ai_data
+
+def _save_verdicts(scored):
+    """
+    Saves the verdicts that are final. A winner still waiting on its pitch isn't saved,
+    so if the pitch never comes back the next scan tries it again.
+    """
+    for article, ai_data in scored:
+        if not _needs_pitch(ai_data):
+            get_score_cache().set(_score_key(article), ai_data, expire=SCORE_CACHE_TTL)
+
+def _add_pitches(scored, pitched):
+    """
+    Merges second-pass pitches into their first-pass verdicts and saves them.
+    Returns the (article, ai_data) pairs that just got their pitch.
+    """
+    verdicts = {_score_key(article): ai_data for article, ai_data in scored}
+    done = []
+    for article, pitch in pitched:
+        ai_data = verdicts[_score_key(article)]
+        ai_data.update(pitch)
+        done.append((article, ai_data))
+    _save_verdicts(done)
+    return done
+
+async def _score_chunk(client, chunk, semaphore, pitch=False):
+    """
+    Sends one batch of articles to the AI in a single request.
+    Returns a list of (article, result) pairs.
+    """
+    async with semaphore:
+        response = await client.chat.completions.create(**_chat_request(chunk, pitch))
+    
+    return _join_results(chunk, response.choices[0].message.content)
+
+async def _semantic_lookup(client, articles):
+    """
+    Embeds the articles in one API call and reuses the score of any near-duplicate
+    we've already scored. Only the score: the headline and pitch were written for the
+    other paper, so reused winners still go through the pitch pass.
+    Returns (reused pairs, articles still to score, vectors by cache key).
+    """
+    import numpy as np
+    
+    response = await client.embeddings.create(
+        model=EMBED_MODEL,
+        input=[f"{a.title}\n{a.summary}" for a in articles]
+    )
+    vectors = np.array([d.embedding for d in response.data], dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    
+    index = get_score_cache().get(SEMANTIC_INDEX_KEY)
+    reused = []
+    remaining = []
+    for article, vector in zip(articles, vectors):
+        if index is not None:
+            similarity = index["vectors"] @ vector
+            best = int(similarity.argmax())
+            if similarity[best] >= SEMANTIC_MATCH:
+                reused.append((article, {"score": index["verdicts"][best]["score"]}))
+                continue
+        remaining.append(article)
+    
+    _save_verdicts(reused)
+    return reused, remaining, {_score_key(a): v for a, v in zip(articles, vectors)}
+
+def _remember_vectors(scored, vectors):
+    """
+    Adds freshly scored articles' scores to the semantic cache, keeping the newest SEMANTIC_CACHE_SIZE.
+    """
+    import numpy as np
+    
+    new_vectors = []
+    new_verdicts = []
+    for article, ai_data in scored:
+        key = _score_key(article)
+        if key in vectors:
+            new_vectors.append(vectors[key])
+            new_verdicts.append({"score": ai_data["score"]})
+    if not new_vectors:
+        return
+    
+    index = get_score_cache().get(SEMANTIC_INDEX_KEY)
+    if index is not None:
+        new_vectors = list(index["vectors"]) + new_vectors
+        new_verdicts = index["verdicts"] + new_verdicts
+    
+    index = {
+        "vectors": np.array(new_vectors[-SEMANTIC_CACHE_SIZE:], dtype=np.float32),
+        "verdicts": new_verdicts[-SEMANTIC_CACHE_SIZE:]
+    }
+    get_score_cache().set(SEMANTIC_INDEX_KEY, index, expire=SCORE_CACHE_TTL)
+
+async def _run_batches(tasks, label, progress_bar, status_text, on_batch=None):
+    """
+    Awaits the batch requests as they come back, keeping the progress bar up to date
+    and handing each batch's pairs to on_batch. Returns all their (article, result) pairs.
+    """
+    joined = []
+    last_ui = 0.0
+    for finished, next_done in enumerate(asyncio.as_completed(tasks), start=1):
+        try:
+            batch = await next_done
+        except Exception as e:
+            print(f"AI Error: {e}")
+        else:
+            joined += batch
+            if on_batch is not None:
+                on_batch(batch)
+        
+        # Every UI update is a round trip to the browser, so when batches land close
+        # together only redraw a few times a second (and always on the last one)
+        now = time.monotonic()
+        if now - last_ui >= 0.2 or finished == len(tasks):
+            status_text.text(f"AI {label} {finished}/{len(tasks)} batches...")
+            progress_bar.progress(finished / len(tasks))
+            last_ui = now
+    return joined
+
+async def _score_all(articles, progress_bar, status_text, on_verdicts):
+    """
+    Scores the articles: near-duplicates from the semantic cache first, then fires all
+    the remaining batches at once and collects the results as they come back, then
+    does the same for the winners' pitches. Finished verdicts are passed to
+    on_verdicts as they arrive, so the UI can show them before the scan is done.
+    """
+    from openai import AsyncOpenAI
+    
+    # The client lives only as long as this event loop (its connections belong to it).
+    # The SDK already retries rate-limit (429) errors with exponential backoff; we just
+    # give it a few more attempts since several batches are in flight at once.
+    async with AsyncOpenAI(api_key=api_key, max_retries=5) as client:
+        try:
+            reused, articles, vectors = await _semantic_lookup(client, articles)
+        except Exception as e:
+            # The semantic cache is only a saving; if embedding fails just score everything
+            print(f"Embedding Error: {e}")
+            reused, vectors = [], {}
+        
+        chunks = chunk_articles(articles)
+        status_text.text(f"AI analyzing {len(articles)} new articles in {len(chunks)} batches ({len(reused)} matched earlier stories)...")
+        
+        semaphore = asyncio.Semaphore(AI_MAX_CONCURRENCY)
+        scored = await _run_batches(
+            [_score_chunk(client, chunk, semaphore) for chunk in chunks],
+            "scored", progress_bar, status_text
+        )
+        _save_verdicts(scored)
+        
+        # Winners get their pitch written, including the ones matched to an earlier story
+        verdicts = reused + scored
+        winners = [article for article, ai_data in verdicts if _needs_pitch(ai_data)]
+        await _run_batches(
+            [_score_chunk(client, chunk, semaphore, pitch=True) for chunk in chunk_articles(winners)],
+            "wrote pitches for", progress_bar, status_text,
+            on_batch=lambda pitched: on_verdicts(_add_pitches(verdicts, pitched))
+        )
+    
+    _remember_vectors(scored, vectors)
+    return verdicts
+
+def _candidate_rank(article):
+    """
+    Cheap local guess at how on-topic an article is: (topic terms hit, source priority).
+    """
+    text = _article_text(article)
+    source = article.source
+    if source.startswith("OpenAlex"):
+        priority = SOURCE_PRIORITY["OpenAlex"]
+    elif source.startswith("OSF"):
+        priority = SOURCE_PRIORITY["OSF"]
+    else:
+        priority = SOURCE_PRIORITY["RSS"]
+    return _count_terms(text, TOPIC_TERMS), priority
+
+def pick_candidates(articles):
+    """
+    Chooses which articles get sent to the AI.
+    """
+    # Cap the analysis at 25 articles to save tokens/time, and make them the 25 most
+    # on-topic ones rather than a random sample, so real matches aren't dropped on luck.
+    return heapq.nlargest(25, articles, key=_candidate_rank)
+
+def split_cached(selection):
+    """
+    Reuses verdicts from earlier scans. Returns (already scored pairs, articles still to score).
+    """
+    scored = []
+    to_score = []
+    for article in selection:
+        ai_data = get_score_cache().get(_score_key(article))
+        if ai_data is None:
+            to_score.append(article)
+        else:
+            scored.append((article, ai_data))
+    return scored, to_score
+
+def chunk_articles(articles):
+    return [articles[i:i + AI_BATCH_SIZE] for i in range(0, len(articles), AI_BATCH_SIZE)]
+
+def keep_winners(scored):
+    """
+    Turns (article, ai_data) pairs into result items, keeping only the good ones.
+    """
+    results = []
+    for article, ai_data in scored:
+        if ai_data.get("score", 0) >= WINNING_SCORE:
+            results.append({
+                "original": article,
+                "ai_data": ai_data
+            })
+    return results
+
+def analyze_with_ai(articles, results):
+    """
+    Scores the candidates and returns the winners. The winners found so far are
+    drawn into the `results` placeholder as they come in, best first.
+    """
+    selection = pick_candidates(articles)
     
     progress_bar = st.progress(0)
     status_text = st.empty()
@@ -215,109 +867,321 @@ def analyze_with_ai(articles):
     if total == 0:
         return []
 
-    for i, article in enumerate(selection):
-        status_text.text(f"AI analyzing {i+1}/{total}: {article['title'][:40]}...")
-        progress_bar.progress((i + 1) / total)
-        
-        prompt = f"""
-        Role: Deputy Short-Form Science Editor at Popular Mechanics.
-        
-        Paper: "{article['title']}"
-        Summary: "{article['summary']}"
-        Source: "{article['source']}"
-        
-        Does this paper meet these CRITERIA?
-        1. TOPIC: Evolution, Biology, Earth Sciences, Environmental Sciences, AI, Futurism, Time, Time Travel, Consciousness, the Mind, Simulation, Holographic, Quantum, Resurrection, 
-        Higher Dimensional Physics, Life Extension
-        2. CONTENT: "Meaningful advance in biology, physics, cognitive psychology, artificial intelligence, Earth sciences, or environmental sciences" or "Contains cause-effect explanations" or "Content can be comprehensibly summarized for Popular Mechanics readers" or "Content can be used to ask and answer meaningful questions"
-        3. EXCLUDE: Education, Policy, Incremental tweaks, boring math proofs.
-        
-        If NO, return JSON: {{"score": 0, "headline": "", "dek": "", "pitch": ""}}
+    # Only the papers we haven't seen before go to the AI
+    scored, to_score = split_cached(selection)
+    
+    found = []
+    def show_found(verdicts):
+        new_winners = keep_winners(verdicts)
+        if new_winners:
+            found.extend(new_winners)
+            show_winners(found, results)
+    show_found(scored)
+
+    if to_score:
+        status_text.text(f"AI checking {len(to_score)} new articles ({len(scored)} already scored)...")
+        scored += asyncio.run(_score_all(to_score, progress_bar, status_text, show_found))
+            
+    status_text.text("Analysis Complete!")
+    progress_bar.empty()
+    return keep_winners(scored)
+
+# --- BACKGROUND (BATCH API) SCAN ---
+# OpenAI's Batch API costs half as much as live calls. It promises results within
+# 24h but usually finishes in minutes, which is fine when nobody is waiting on the scan.
+
+# The pending job is kept on disk rather than in the session, so a page reload (or
+# another tab) still collects it instead of leaving a paid-for job behind
+BATCH_JOB_KEY = "batch-scan"
+BATCH_JOB_TTL = 2 * 86400 # Past the 24h completion window, the job is gone anyway
+
+def _submit_batch(chunks, pitch=False):
+    """
+    Uploads one request per chunk as a Batch API job. Returns the job id.
+    """
+    batch_client = get_batch_client()
+    lines = [
+        orjson.dumps({
+            "custom_id": f"chunk-{i}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": _chat_request(chunk, pitch)
+        })
+        for i, chunk in enumerate(chunks)
+    ]
+    
+    batch_file = batch_client.files.create(
+        file=("sns_batch.jsonl", b"\n".join(lines)),
+        purpose="batch"
+    )
+    batch = batch_client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    return batch.id
+
+def _read_batch(batch, chunks):
+    """
+    Downloads a finished Batch API job's output. Returns its (article, result) pairs.
+    """
+    joined = []
+    if not batch.output_file_id:
+        return joined
+    
+    for line in get_batch_client().files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        row = orjson.loads(line)
+        response = row.get("response") or {}
+        if response.get("status_code") != 200:
+            print(f"Batch Error on {row.get('custom_id')}: {row.get('error')}")
+            continue
         
-        If YES, create a compelling story pitch with:
-        - score: 7-10 based on newsworthiness and reader appeal
-        - headline: Punchy, engaging headline in Popular Mechanics style (8-12 words)
-        - dek: One-sentence subhead that expands on the headline (15-25 words)
-        - pitch: A vivid, conversational pitch paragraph (100-150 words) that:
-          * Summarizes the research clearly without jargon
-          * Explains WHY this matters to general readers
-          * Highlights the broader implications or "wow" factor
-          * Uses accessible language and concrete examples
-          * Captures Popular Mechanics' voice: curious, intelligent, but never stuffy
+        chunk = chunks[int(row["custom_id"].split("-")[1])]
+        try:
+            joined += _join_results(chunk, response["body"]["choices"][0]["message"]["content"])
+        except Exception as e:
+            print(f"Batch Error on {row['custom_id']}: {e}")
+    return joined
+
+def _save_batch_job(job_id, pitch, chunks, scored, new=()):
+    """
+    Remembers the pending Batch API job. Articles are stored as plain tuples so the
+    pickled job doesn't depend on the Article class.
+    """
+    get_score_cache().set(BATCH_JOB_KEY, {
+        "id": job_id,
+        "pitch": pitch,
+        "chunks": [[astuple(a) for a in chunk] for chunk in chunks],
+        "scored": [(astuple(a), ai_data) for a, ai_data in scored],
+        "new": [(astuple(a), ai_data) for a, ai_data in new]
+    }, expire=BATCH_JOB_TTL)
+
+def _load_pairs(rows):
+    return [(Article(*row), ai_data) for row, ai_data in rows]
+
+def submit_batch_scan(articles):
+    """
+    Uploads the uncached articles as a Batch API job (the scoring pass) and remembers it.
+    Returns the already-scored pairs when everything was already scored (nothing is
+    submitted), otherwise None (after telling the user how the submission went).
+    """
+    scored, to_score = split_cached(pick_candidates(articles))
+    if not to_score:
+        return scored
+    
+    # Another tab may have submitted one while we were fetching. Only one job is
+    # remembered, so a second submission would orphan the first (and still be billed).
+    if BATCH_JOB_KEY in get_score_cache():
+        st.info("A background scan is already running. Its results will show up here when it's done.")
+        return None
+    
+    chunks = chunk_articles(to_score)
+    try:
+        _save_batch_job(_submit_batch(chunks), False, chunks, scored)
+    except Exception as e:
+        print(f"Batch Error: {e}")
+        st.error("Couldn't submit the background scan to OpenAI. Please try again in a minute.")
+        return None
+    
+    st.success(f"Found {len(articles)} candidates after filtering junk. Background scan submitted; results will show up here when it's done.")
+    return None
+
+def collect_batch_scan():
+    """
+    Checks on the pending Batch API job. When the scoring pass finishes, submits the
+    pitch-writing pass for its winners. Returns the winners once everything has
+    finished, otherwise None (after telling the user what the job is up to).
+    """
+    job = get_score_cache().get(BATCH_JOB_KEY)
+    if job is None:
+        return None
+    stage = "pitch-writing" if job["pitch"] else "scoring"
+    
+    try:
+        batch = get_batch_client().batches.retrieve(job["id"])
+    except Exception as e:
+        print(f"Batch Error on {job['id']}: {e}")
+        st.warning("Couldn't reach OpenAI to check on the background scan. Try again in a minute.")
+        st.button("Check again")
+        return None
+    
+    if batch.status in ("failed", "expired", "cancelled"):
+        st.error(f"Background scan {batch.status}. Please run it again.")
+        get_score_cache().delete(BATCH_JOB_KEY)
+        return None
+    
+    if batch.status != "completed":
+        counts = batch.request_counts # Not filled in until the job has been validated
+        done = f" ({counts.completed}/{counts.total} batches done)" if counts else ""
+        st.info(f"Background scan ({stage}) is {batch.status}{done}. Check back in a few minutes.")
+        st.button("Check again")
+        return None
+    
+    if not batch.output_file_id:
+        # "completed" with every request failed: there's only an error file. Nothing gets
+        # saved, so the next scan tries these articles again.
+        print(f"Batch Error on {job['id']}: no output, errors in {batch.error_file_id}")
+        st.error(f"Background scan ({stage}) failed on OpenAI's side. Please run it again.")
+        get_score_cache().delete(BATCH_JOB_KEY)
+        return None
+    
+    # Take the job off the list before collecting it, so two tabs polling at the same
+    # moment don't both collect it (and both submit the pitch pass)
+    if get_score_cache().pop(BATCH_JOB_KEY) is None:
+        return None
+    
+    chunks = [[Article(*row) for row in chunk] for chunk in job["chunks"]]
+    try:
+        joined = _read_batch(batch, chunks)
+    except Exception as e:
+        print(f"Batch Error on {job['id']}: {e}")
+        get_score_cache().set(BATCH_JOB_KEY, job, expire=BATCH_JOB_TTL) # Put it back for the next try
+        st.warning("Couldn't download the background scan results. Try again in a minute.")
+        st.button("Check again")
+        return None
+    
+    counts = batch.request_counts
+    if batch.error_file_id or (counts and counts.failed):
+        failed = f" ({counts.failed} of {counts.total} batches)" if counts and counts.failed else ""
+        missed = "winners have no pitch yet" if job["pitch"] else "articles weren't scored"
+        st.warning(f"Part of the background scan ({stage}) failed{failed}. Those {missed}; the next scan will try them again.")
+    
+    already_scored = _load_pairs(job["scored"])
+    if job["pitch"]:
+        scored = _load_pairs(job["new"])
+        _add_pitches(scored, joined)
+    else:
+        scored = joined
+        _save_verdicts(scored) # The rejects are already final
+        winners = [article for article, ai_data in scored if _needs_pitch(ai_data)]
+        if winners:
+            # Second pass: pitches for the winners only
+            chunks = chunk_articles(winners)
+            try:
+                _save_batch_job(_submit_batch(chunks, pitch=True), True, chunks, already_scored, scored)
+            except Exception as e:
+                # Show the winners without pitches; they weren't saved, so the next scan redoes them
+                print(f"Batch Error: {e}")
+                st.warning("Couldn't submit the pitch-writing pass, so these winners have no pitches yet. Run the scan again to get them.")
+                return keep_winners(already_scored + scored)
+            st.info(f"Background scan scored {len(scored)} articles; now writing pitches for {len(winners)}. Check back in a few minutes.")
+            st.button("Check again")
+            return None
+    
+    return keep_winners(already_scored + scored)
+
+# --- MAIN APP UI ---
+
+# Streamlit reruns the whole script on every click, so the fetched candidate list is
+# kept for 10 minutes and a repeat scan goes straight to the (also cached) AI stage.
+# (_refresh has a leading underscore so Streamlit leaves it out of the cache key.)
+# The cached value is plain tuples: st.cache_data pickles it, and Article lives in the
+# script's __main__, which Streamlit swaps out whenever any session reruns.
+@st.cache_data(ttl=600, show_spinner=False)
+def _fetch_candidates(_refresh=False):
+    """
+    Fetches every source and returns the de-duplicated candidates as
+    (title, link, summary, source) tuples.
+    _refresh=True downloads every source again instead of using cached responses.
+    """
+    # Fetch from all sources in parallel (we only wait as long as the slowest one).
+    # The worker threads get the script context so their st.write messages still show up.
+    fetchers = [fetch_openalex_targeted, fetch_osf_preprints, fetch_rss_feeds]
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=len(fetchers),
+        initializer=add_script_run_ctx,
+        initargs=(None, get_script_run_ctx())
+    ) as executor:
+        list_1, list_2, list_3 = executor.map(lambda fetch: fetch(_refresh), fetchers)
+    
+    all_articles = [a for a in list_1 + list_2 + list_3 if is_scoreable(a)]
+    unique = dedupe_articles(all_articles) # Remove duplicates
+    
+    # Anything the keyword pre-check rules out never costs an AI call
+    candidates = [a for a in unique if worth_scoring(a)]
+    if unique:
+        st.caption(f"Pre-filter dropped {len(unique) - len(candidates)} of {len(unique)} articles as off-topic or low-value.")
+    return [(a.title, a.link, a.summary, a.source) for a in candidates]
+
+def gather_candidates(refresh=False):
+    """
+    Returns the de-duplicated list of candidate articles (fetched or from the last 10 minutes).
+    """
+    return [Article(*row) for row in _fetch_candidates(_refresh=refresh)]
+
+def show_winners(winners, placeholder=None):
+    """
+    Draws the winners list. Given a placeholder (st.empty) it draws into that, replacing
+    what was there, so the list can be redrawn as more winners come in.
+    """
+    # Sort by score
+    winners.sort(key=lambda x: x['ai_data']['score'], reverse=True)
+    
+    with placeholder.container() if placeholder is not None else st.container():
+        st.header(f"Today's Top Picks ({len(winners)})")
         
-        Return JSON: {{"score": 8, "headline": "...", "dek": "...", "pitch": "..."}}
-        """
+        if len(winners) == 0:
+            st.warning("No hits found. (If you still see nothing, the date window might be too tight for these specific topics).")
         
-        try:
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "system", "content": "You output only valid JSON."},
-                          {"role": "user", "content": prompt}],
-                response_format={"type": "json_object"},
-                temperature=0.7
-            )
+        for item in winners:
+            score = item['ai_data']['score']
+            headline = item['ai_data'].get('headline', 'No headline generated')
+            dek = item['ai_data'].get('dek', '')
+            pitch = item['ai_data'].get('pitch', 'No pitch generated')
             
-            data = json.loads(response.choices[0].message.content)
-            
-            if data.get("score", 0) >= 6:
-                results.append({
-                    "original": article,
-                    "ai_data": data
-                })
+            with st.expander(f"[{score}/10] {headline}", expanded=True):
+                if dek:
+                    st.markdown(f"*{dek}*")
+                    st.markdown("---")
                 
-        except Exception as e:
-            continue
-            
-    status_text.text("Analysis Complete!")
-    progress_bar.empty()
-    return results
+                st.markdown(f"**Pitch:**")
+                st.markdown(pitch)
+                st.markdown("---")
+                
+                st.markdown(f"**Source:** [{item['original'].source}]({item['original'].link})")
+                st.caption(f"**Original Title:** {item['original'].title}")
 
-# --- MAIN APP UI ---
 st.set_page_config(page_title="PopMech Science News Scanner", layout="wide")
 
 st.title("📡 Science News Scanner")
 st.markdown(f"**Scanning Window:** {START_DATE} to Present")
 st.markdown("AI & Futurism; Time & Time Travel; Consciousness & the Mind; Simulation & Holographic Reality; Quantum & Higher-Dimensional Physics; Biology & Evolution; Earth & Environment; Life Extension & Bio Resurrections")
 
-if st.button("Run Scan"):
+run_now = st.button("Run Scan")
+run_background = st.button("Background Scan (50% cheaper, results in a few minutes)")
+force_refresh = st.checkbox("Force refresh (re-download every source instead of reusing recent results)")
+
+if (run_now or run_background) and force_refresh:
+    _fetch_candidates.clear()
+
+if run_now:
     with st.spinner("Executing targeted search patterns..."):
         
         # 1. Fetch from all sources
-        list_1 = fetch_openalex_targeted()
-        list_2 = fetch_osf_preprints()
-        list_3 = fetch_rss_feeds()
-        
-        all_articles = list_1 + list_2 + list_3
-        unique_articles = {v['title']:v for v in all_articles}.values() # Remove duplicates
-        final_list = list(unique_articles)
+        final_list = gather_candidates(refresh=force_refresh)
         
         st.success(f"Found {len(final_list)} candidates after filtering junk. Sending to AI...")
         
-        # 2. Analyze
-        winners = analyze_with_ai(final_list)
+        # 2. Analyze (winners show up below as they come in)
+        results = st.empty()
+        winners = analyze_with_ai(final_list, results)
         
-        # Sort by score
-        winners.sort(key=lambda x: x['ai_data']['score'], reverse=True)
-        
-    st.header(f"Today's Top Picks ({len(winners)})")
-    
-    if len(winners) == 0:
-        st.warning("No hits found. (If you still see nothing, the date window might be too tight for these specific topics).")
+    show_winners(winners, results)
+
+elif run_background and BATCH_JOB_KEY not in get_score_cache():
+    with st.spinner("Executing targeted search patterns..."):
+        final_list = gather_candidates(refresh=force_refresh)
+        already_scored = submit_batch_scan(final_list)
     
-    for item in winners:
-        score = item['ai_data']['score']
-        headline = item['ai_data'].get('headline', 'No headline generated')
-        dek = item['ai_data'].get('dek', '')
-        pitch = item['ai_data'].get('pitch', 'No pitch generated')
-        
-        with st.expander(f"[{score}/10] {headline}", expanded=True):
-            if dek:
-                st.markdown(f"*{dek}*")
-                st.markdown("---")
-            
-            st.markdown(f"**Pitch:**")
-            st.markdown(pitch)
-            st.markdown("---")
-            
-            st.markdown(f"**Source:** [{item['original']['source']}]({item['original']['link']})")
-            st.caption(f"**Original Title:** {item['original']['title']}")
+    if already_scored is not None:
+        # Everything was already in the score cache, no need to wait on OpenAI
+        show_winners(keep_winners(already_scored))
+
+elif BATCH_JOB_KEY in get_score_cache():
+    if run_background:
+        st.info("A background scan is already running, so no new one was submitted. Here's how it's doing:")
+    winners = collect_batch_scan()
+    if winners is not None:
+        show_winners(winners)
@@ -0,0 +1 @@
+# Lets the tests import the app modules (feed_parser) from the repo root
@@ -0,0 +1,87 @@
+"""
+Minimal RSS/Atom parser used by Science_News_Scanner.py as the fast path in front of feedparser.
+"""
+import io
+
+from lxml import etree
+
+# RSS 1.0 "content" module. Some feeds (Nature's RDF ones) put the item's text only in
+# <content:encoded>, which feedparser falls back to when there's no description.
+CONTENT_NS = 'http://purl.org/rss/1.0/modules/content/'
+
+# The feed formats' own elements: RSS 2.0 (no namespace), RSS 1.0 and Atom. Extension
+# elements like dc:title, media:description or itunes:summary share the local names
+# but aren't the fields we want, so they're skipped.
+FEED_NAMESPACES = (None, 'http://purl.org/rss/1.0/', 'http://www.w3.org/2005/Atom')
+
+def _node_text(elem):
+    return ''.join(elem.itertext()).strip()
+
+def _entry_fields(elem):
+    """
+    Reads title/link/summary from one RSS <item> or Atom <entry>.
+    """
+    title = ''
+    link = None
+    summary = ''
+    encoded = ''
+    for child in elem:
+        if not isinstance(child.tag, str): # comments / processing instructions
+            continue
+        qname = etree.QName(child)
+        name = qname.localname
+        if qname.namespace == CONTENT_NS and name == 'encoded':
+            encoded = _node_text(child)
+        elif qname.namespace not in FEED_NAMESPACES:
+            continue
+        elif name == 'title':
+            title = _node_text(child)
+        elif name == 'link':
+            href = child.get('href') # Atom puts the URL in an attribute, RSS in the text
+            if href:
+                if link is None or child.get('rel', 'alternate') == 'alternate':
+                    link = href
+            elif link is None and child.text:
+                link = child.text.strip()
+        elif name in ('description', 'summary') or (name == 'content' and not summary):
+            summary = _node_text(child)
+    return {'title': title, 'link': link, 'summary': (summary or encoded)[:600]}
+
+def parse_minimal(xml_bytes, limit):
+    """
+    Fast path for feeds: pulls just the feed title and the first `limit` entries'
+    title/link/summary out of RSS 1.0/2.0 or Atom with lxml, instead of having
+    feedparser build and normalize the whole document.
+    Returns (feed title or None, [entry dicts]).
+    """
+    feed_title = None
+    entries = []
+    in_entry = False
+    try:
+        for event, elem in etree.iterparse(io.BytesIO(xml_bytes), events=('start', 'end'),
+                                           resolve_entities=False, no_network=True):
+            qname = etree.QName(elem)
+            if qname.namespace not in FEED_NAMESPACES:
+                continue
+            name = qname.localname
+            if name in ('item', 'entry'):
+                if event == 'start':
+                    in_entry = True
+                    continue
+                in_entry = False
+                entries.append(_entry_fields(elem))
+                # Free what we've already read so memory stays flat on huge feeds
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+                if len(entries) >= limit:
+                    break
+            elif event == 'end' and name == 'title' and not in_entry and feed_title is None:
+                feed_title = _node_text(elem)
+    except etree.LxmlError as e:
+        # No recover mode: after a broken bit (an undefined &nbsp; and the like) lxml's
+        # recovered text is garbage for the rest of the feed. Return nothing so the
+        # caller hands the feed to feedparser instead of caching half-mangled entries.
+        print(f"Feed parse error, falling back to feedparser: {e}")
+        return None, []
+    return feed_title, entries
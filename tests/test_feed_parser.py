@@ -0,0 +1,95 @@
+"""
+Checks the lxml fast path in feed_parser against feedparser, which it stands in for.
+"""
+import feedparser
+import pytest
+
+from feed_parser import parse_minimal
+
+RSS2 = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/" xmlns:dc="http://purl.org/dc/elements/1.1/">
+<channel>
+  <title>Science Daily</title>
+  <link>https://example.org/</link>
+  <item>
+    <title>Quantum sensor spots dark matter candidate</title>
+    <link>https://example.org/1</link>
+    <description>Researchers report a new quantum sensor.</description>
+    <media:title>Thumbnail caption</media:title>
+    <dc:title>Dublin Core title</dc:title>
+  </item>
+  <item>
+    <title>Synthetic biology makes a new enzyme</title>
+    <link>https://example.org/2</link>
+    <description>The enzyme breaks down plastic.</description>
+  </item>
+</channel>
+</rss>"""
+
+RDF = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" xmlns="http://purl.org/rss/1.0/"
+         xmlns:content="http://purl.org/rss/1.0/modules/content/" xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel rdf:about="https://example.org/rdf">
+    <title>Nature Physics</title>
+    <link>https://example.org/nphys</link>
+  </channel>
+  <item rdf:about="https://example.org/nphys/1">
+    <title>Time crystals in a superconducting loop</title>
+    <link>https://example.org/nphys/1</link>
+    <content:encoded><![CDATA[<p>Nature Physics, Published online: 14 October 2026</p>Time crystals in a superconducting loop]]></content:encoded>
+    <dc:title>Time crystals in a superconducting loop</dc:title>
+  </item>
+</rdf:RDF>"""
+
+ATOM = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>arXiv quant-ph</title>
+  <entry>
+    <title>Entanglement across a kilometre of fibre</title>
+    <link rel="related" href="https://example.org/related"/>
+    <link rel="alternate" href="https://example.org/abs/1"/>
+    <summary>We distribute entangled photons over fibre.</summary>
+  </entry>
+</feed>"""
+
+# &nbsp; isn't defined in XML, so this is not well-formed
+MALFORMED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+<channel>
+  <title>Broken Feed</title>
+  <item>
+    <title>First&nbsp;story about fusion</title>
+    <link>https://example.org/a</link>
+    <description>Fusion record.</description>
+  </item>
+  <item>
+    <title>Second story about cloning</title>
+    <link>https://example.org/b</link>
+    <description>Cloning news.</description>
+  </item>
+</channel>
+</rss>"""
+
+def _feedparser_fields(xml_bytes):
+    feed = feedparser.parse(xml_bytes, sanitize_html=False, resolve_relative_uris=False)
+    entries = [{'title': e.get('title', ''), 'link': e.get('link'), 'summary': e.get('summary', '')[:600]}
+               for e in feed.entries]
+    return feed.feed.get('title'), entries
+
+@pytest.mark.parametrize('xml_bytes', [RSS2, RDF, ATOM], ids=['rss2', 'rdf', 'atom'])
+def test_matches_feedparser(xml_bytes):
+    assert parse_minimal(xml_bytes, limit=10) == _feedparser_fields(xml_bytes)
+
+def test_ignores_extension_elements():
+    _, entries = parse_minimal(RSS2, limit=10)
+    assert entries[0]['title'] == 'Quantum sensor spots dark matter candidate'
+
+def test_limit():
+    _, entries = parse_minimal(RSS2, limit=1)
+    assert [e['link'] for e in entries] == ['https://example.org/1']
+
+def test_malformed_feed_is_left_to_feedparser():
+    assert parse_minimal(MALFORMED, limit=10) == (None, [])
+    # ...which still reads it
+    _, entries = _feedparser_fields(MALFORMED)
+    assert [e['link'] for e in entries] == ['https://example.org/a', 'https://example.org/b']